@@ -22,14 +22,14 @@ except ImportError as e:
     AI_PARSER_AVAILABLE = False
 
 try:
-    from swap_service import OneinchService
+    from swap_service import OneinchService, shutdown as shutdown_swap_service
     SWAP_SERVICE_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Could not import swap_service: {e}")
     SWAP_SERVICE_AVAILABLE = False
 
 try:
-    from wallet import SimpleWallet
+    from wallet import SimpleWallet, shutdown as shutdown_wallet
     WALLET_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Could not import wallet: {e}")
@@ -42,6 +42,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Transaction URL prefix per blockchain explorer
+EXPLORERS = {
+    "ethereum": "https://etherscan.io/tx/",
+    "arbitrum": "https://arbiscan.io/tx/",
+    "polygon": "https://polygonscan.com/tx/",
+    "optimism": "https://optimistic.etherscan.io/tx/",
+    "base": "https://basescan.org/tx/"
+}
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Cross-Chain Swap Assistant",
@@ -110,6 +119,14 @@ async def startup_event():
 
     logger.info("Services initialized successfully")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on application shutdown"""
+    if SWAP_SERVICE_AVAILABLE:
+        await shutdown_swap_service()
+    if WALLET_AVAILABLE:
+        await shutdown_wallet()
+
 @app.get("/", response_model=Dict[str, str])
 async def root():
     """Root endpoint"""
@@ -268,7 +285,7 @@ async def ai_swap(request: SwapRequest):
         # Phase 3: Build & Execute Transaction - UPDATED WITH LIVE BROADCASTING
         try:
             if WALLET_AVAILABLE:
-                wallet = SimpleWallet()
+                wallet = SimpleWallet.shared()
                 if wallet.address:
                     debug_info["wallet_address"] = wallet.address
 
@@ -433,7 +450,7 @@ async def execute_live_transaction(
         logger.warning("🚨 STARTING LIVE BLOCKCHAIN TRANSACTION")
 
         # Step 1: Sign the transaction
-        signed_result = wallet.sign_transaction(parsed_intent.from_chain, tx_data)
+        signed_result = await wallet.sign_transaction(parsed_intent.from_chain, tx_data)
 
         if not signed_result.get("success"):
             raise Exception(f"Transaction signing failed: {signed_result.get('error')}")
@@ -444,7 +461,9 @@ async def execute_live_transaction(
         logger.warning(f"🚨 BROADCASTING TRANSACTION: {real_tx_hash}")
 
         # Step 2: BROADCAST TO BLOCKCHAIN
-        broadcast_result = await wallet.broadcast_transaction(parsed_intent.from_chain, signed_tx)
+        broadcast_result = await wallet.broadcast_transaction(
+            parsed_intent.from_chain, signed_tx, nonce=signed_result["nonce"]
+        )
 
         if broadcast_result.get("success"):
             logger.warning(f"✅ LIVE TRANSACTION BROADCASTED: {real_tx_hash}")
@@ -498,7 +517,7 @@ async def execute_simulation_transaction(
         logger.info("📋 Executing simulation transaction (safe mode)")
 
         # Sign the real transaction but don't broadcast
-        signed_result = wallet.sign_transaction(parsed_intent.from_chain, tx_data)
+        signed_result = await wallet.sign_transaction(parsed_intent.from_chain, tx_data, reserve_nonce=False)
 
         if signed_result.get("success"):
             real_tx_hash = signed_result["transaction_hash"]
@@ -537,19 +556,10 @@ async def execute_mock_transaction(
 
     mock_hash = "0x" + hashlib.sha256(hash_input.encode()).hexdigest()
 
-    # Get explorer URL
-    explorers = {
-        "ethereum": "https://etherscan.io/tx/",
-        "arbitrum": "https://arbiscan.io/tx/",
-        "polygon": "https://polygonscan.com/tx/"
-    }
-
-    explorer_base = explorers.get(parsed_intent.from_chain, "https://etherscan.io/tx/")
-
     return {
         "transaction_hash": mock_hash,
         "status": "mock_pending",
-        "explorer_url": f"{explorer_base}{mock_hash}",
+        "explorer_url": get_explorer_url(parsed_intent.from_chain, mock_hash),
         "is_mock": True,
         "execution_type": "mock",
         "note": "Mock transaction for testing purposes"
@@ -588,7 +598,7 @@ async def create_real_transaction_fixed(
             is_real_1inch_tx = False
 
         # Sign the transaction to get a real hash
-        signed_result = wallet.sign_transaction(parsed_intent.from_chain, tx_data)
+        signed_result = await wallet.sign_transaction(parsed_intent.from_chain, tx_data, reserve_nonce=False)
 
         if signed_result and signed_result.get("success"):
             real_hash = signed_result["transaction_hash"]
@@ -622,7 +632,7 @@ async def simulate_real_transaction(
             logger.info("🔥 Using REAL 1inch transaction data for simulation")
 
             # Sign the REAL transaction (creates real hash)
-            signed_result = wallet.sign_transaction(chain, tx_data)
+            signed_result = await wallet.sign_transaction(chain, tx_data, reserve_nonce=False)
 
             if signed_result.get("success"):
                 return {
@@ -747,7 +757,7 @@ async def create_real_transaction(
             }
 
         # Sign the transaction to get a real hash
-        signed_result = wallet.sign_transaction(parsed_intent.from_chain, tx_data)
+        signed_result = await wallet.sign_transaction(parsed_intent.from_chain, tx_data, reserve_nonce=False)
 
         if signed_result and signed_result.get("success"):
             real_hash = signed_result["transaction_hash"]
@@ -814,16 +824,7 @@ def generate_realistic_hash(wallet_address: str, chain: str) -> str:
 
 def get_explorer_url(chain: str, tx_hash: str) -> str:
     """Get explorer URL for a transaction hash"""
-    explorers = {
-        "ethereum": "https://etherscan.io/tx/",
-        "arbitrum": "https://arbiscan.io/tx/",
-        "polygon": "https://polygonscan.com/tx/",
-        "optimism": "https://optimistic.etherscan.io/tx/",
-        "base": "https://basescan.org/tx/"
-    }
-
-    base_url = explorers.get(chain.lower(), "https://etherscan.io/tx/")
-    return f"{base_url}{tx_hash}"
+    return f"{EXPLORERS.get(chain.lower(), 'https://etherscan.io/tx/')}{tx_hash}"
 
 def determine_execution_mode(tx_data: Dict[str, Any], debug_info: Dict[str, Any]) -> str:
     """
@@ -1388,7 +1389,7 @@ async def get_wallet_balance():
         if not WALLET_AVAILABLE:
             return {"error": "Wallet module not available"}
 
-        wallet = SimpleWallet(os.getenv("PRIVATE_KEY"))
+        wallet = SimpleWallet.shared()
         balance = await wallet.get_balance("ethereum")
 
         # Convert to different units for clarity
@@ -1423,7 +1424,7 @@ async def get_wallet_address():
         if not WALLET_AVAILABLE:
             return {"error": "Wallet module not available"}
 
-        wallet = SimpleWallet(os.getenv("PRIVATE_KEY"))
+        wallet = SimpleWallet.shared()
         return {
             "address": wallet.address,
             "private_key_configured": bool(os.getenv("PRIVATE_KEY")),
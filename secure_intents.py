@@ -282,24 +282,17 @@ class SecureIntentFramework:
             if hasattr(self, 'oneinch_service_class') and self.oneinch_service_class is not None:
                 # Use real 1inch service to build transaction
                 async with self.oneinch_service_class() as oneinch:
-                    quote_data = await oneinch.get_quote(
+                    # Quote and swap payload are fetched concurrently where possible
+                    bundle = await oneinch.get_quote_bundle(
                         from_token=secure_intent.swap_intent.from_token,
                         to_token=secure_intent.swap_intent.to_token,
                         amount=secure_intent.swap_intent.amount,
                         from_chain=secure_intent.swap_intent.from_chain,
                         to_chain=secure_intent.swap_intent.to_chain,
-                        slippage=secure_intent.swap_intent.slippage
-                    )
-
-                    tx_data = await oneinch.build_transaction(
-                        quote_data=quote_data,
                         wallet_address=wallet.address if wallet else "0x0000000000000000000000000000000000000000",
-                        from_token=secure_intent.swap_intent.from_token,
-                        to_token=secure_intent.swap_intent.to_token,
-                        amount=secure_intent.swap_intent.amount,
-                        from_chain=secure_intent.swap_intent.from_chain,
                         slippage=secure_intent.swap_intent.slippage
                     )
+                    tx_data = bundle["transaction"]
 
                     logger.info("✅ Built real transaction data using 1inch service")
                     return tx_data
@@ -355,7 +348,7 @@ class SecureIntentAPI:
                 self.wallet = SimpleWallet(private_key_hex)
                 logger.info("✅ Integrated with existing wallet module")
             else:
-                self.wallet = SimpleWallet()
+                self.wallet = SimpleWallet.shared()
                 logger.warning("⚠️ Wallet initialized without private key")
         except ImportError:
             logger.warning("⚠️ Wallet module not available for integration")
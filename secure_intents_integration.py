@@ -6,6 +6,7 @@ Provides enhanced FastAPI endpoints with cryptographic security guarantees
 """
 
 import os
+import asyncio
 import logging
 import time
 import json
@@ -51,6 +52,38 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Credential presence flags, resolved once at import (see _refresh_env)
+_HAS_ONEINCH = bool(os.getenv("ONEINCH_API_KEY"))
+_HAS_PRIVKEY = bool(os.getenv("PRIVATE_KEY"))
+_HAS_OPENAI = bool(os.getenv("OPENAI_API_KEY"))
+
+def _build_integration_status() -> Dict[str, str]:
+    """Build the static part of the dashboard integration status"""
+    return {
+        "ai_parser": "✅ Integrated" if AI_PARSER_AVAILABLE else "❌ Not available",
+        "oneinch_service": "✅ Available" if _HAS_ONEINCH else "❌ No API key",
+        "wallet_module": "✅ Available" if _HAS_PRIVKEY else "❌ No private key",
+        "secure_intents": "✅ Active"
+    }
+
+_INTEGRATION_STATUS = _build_integration_status()
+
+def _refresh_env() -> None:
+    """Re-read credential flags from the environment (admin use after live changes)"""
+    global _HAS_ONEINCH, _HAS_PRIVKEY, _HAS_OPENAI, _INTEGRATION_STATUS
+
+    _HAS_ONEINCH = bool(os.getenv("ONEINCH_API_KEY"))
+    _HAS_PRIVKEY = bool(os.getenv("PRIVATE_KEY"))
+    _HAS_OPENAI = bool(os.getenv("OPENAI_API_KEY"))
+    _INTEGRATION_STATUS = _build_integration_status()
+
+# Precompiled response message templates
+_MULTISIG_MSG = "Large trade detected ({amount} ETH) - requires multi-signature approval".format_map
+_MULTISIG_NEXT_STEPS = "Use /multisig/approve/{intent_id} to add approvals".format_map
+_EXECUTE_NEXT_STEP = "Use /intent/execute/{intent_id} to execute".format_map
+_PROGRESS_MSG = "{signatures_collected}/{signatures_required}".format_map
+_REMAINING_MSG = "Need {signatures_remaining} more signature(s)".format_map
+
 # Enhanced Pydantic models for secure intents
 
 class SecureSwapRequest(BaseModel):
@@ -172,8 +205,8 @@ async def secure_swap(request: SecureSwapRequest) -> Dict[str, Any]:
                 "intent_id": secure_intent_result["intent_id"],
                 "security_level": "enterprise",
                 "approval_status": secure_intent_result["approval_status"],
-                "message": f"Large trade detected ({secure_intent_result['amount']} ETH) - requires multi-signature approval",
-                "next_steps": f"Use /multisig/approve/{secure_intent_result['intent_id']} to add approvals",
+                "message": _MULTISIG_MSG(secure_intent_result),
+                "next_steps": _MULTISIG_NEXT_STEPS(secure_intent_result),
                 "security_enhancement": "Threshold signature protection active",
                 "compliance_reason": secure_intent_result.get("reason", "Risk management requirement")
             }
@@ -327,14 +360,13 @@ async def approve_multisig_intent(request: MultiSigApprovalRequest) -> Dict[str,
     try:
         intent_id = request.intent_id
 
-        if intent_id not in secure_intent_api.multisig_intents:
+        multisig_intent = secure_intent_api.multisig_intents.get(intent_id)
+        if multisig_intent is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Multi-signature intent {intent_id} not found"
             )
 
-        multisig_intent = secure_intent_api.multisig_intents[intent_id]
-
         # Add the signature
         success = multisig_intent.add_signature(
             signer_id=request.signer_id,
@@ -356,16 +388,15 @@ async def approve_multisig_intent(request: MultiSigApprovalRequest) -> Dict[str,
             "signer_id": request.signer_id,
             "approval_status": approval_status,
             "ready_for_execution": approval_status["ready_for_execution"],
-            "progress": f"{approval_status['signatures_collected']}/{approval_status['signatures_required']}"
+            "progress": _PROGRESS_MSG(approval_status)
         }
 
         # If ready for execution, provide next steps
         if approval_status["ready_for_execution"]:
             response["message"] = "Intent ready for execution!"
-            response["next_step"] = f"Use /intent/execute/{intent_id} to execute"
+            response["next_step"] = _EXECUTE_NEXT_STEP({"intent_id": intent_id})
         else:
-            remaining = approval_status["signatures_remaining"]
-            response["message"] = f"Need {remaining} more signature(s)"
+            response["message"] = _REMAINING_MSG(approval_status)
 
         return response
 
@@ -396,20 +427,16 @@ async def security_dashboard() -> Dict[str, Any]:
         dashboard = secure_intent_api.get_security_dashboard()
 
         # Add integration status with existing modules
-        dashboard["integration_status"] = {
-            "ai_parser": "✅ Integrated" if AI_PARSER_AVAILABLE else "❌ Not available",
-            "oneinch_service": "✅ Available" if os.getenv("ONEINCH_API_KEY") else "❌ No API key",
-            "wallet_module": "✅ Available" if os.getenv("PRIVATE_KEY") else "❌ No private key",
-            "secure_intents": "✅ Active",
-            "cryptographic_backend": dashboard.get("cryptographic_backend", "Unknown")
-        }
+        integration_status = dict(_INTEGRATION_STATUS)
+        integration_status["cryptographic_backend"] = dashboard.get("cryptographic_backend", "Unknown")
+        dashboard["integration_status"] = integration_status
 
         # Add system health indicators
         dashboard["system_health"] = {
             "framework_operational": True,
             "cryptography_available": CRYPTOGRAPHY_AVAILABLE,
-            "api_keys_configured": bool(os.getenv("OPENAI_API_KEY")) and bool(os.getenv("ONEINCH_API_KEY")),
-            "wallet_configured": bool(os.getenv("PRIVATE_KEY"))
+            "api_keys_configured": _HAS_OPENAI and _HAS_ONEINCH,
+            "wallet_configured": _HAS_PRIVKEY
         }
 
         return dashboard
@@ -608,11 +635,10 @@ async def analyze_intent_security_properties(intent_id: str) -> Dict[str, Any]:
     if not SECURE_INTENTS_AVAILABLE or not secure_intent_api:
         raise HTTPException(status_code=503, detail="Secure Intents not available")
 
-    if intent_id not in secure_intent_api.framework.intent_registry:
+    secure_intent = secure_intent_api.framework.intent_registry.get(intent_id)
+    if secure_intent is None:
         raise HTTPException(status_code=404, detail="Intent not found")
 
-    secure_intent = secure_intent_api.framework.intent_registry[intent_id]
-
     return {
         "intent_id": intent_id,
         "security_analysis": {
@@ -697,7 +723,6 @@ def integrate_secure_intents_with_existing_app(existing_app, private_key: Option
         @existing_app.on_event("startup")
         async def setup_periodic_cleanup():
             """Set up periodic cleanup of expired intents"""
-            import asyncio
 
             async def cleanup_task():
                 while True:
@@ -736,44 +761,42 @@ async def test_secure_intents_integration():
     if not secure_intent_api:
         initialize_secure_intents()
 
-    test_results = {
-        "tests_passed": 0,
-        "tests_failed": 0,
-        "details": []
-    }
-
-    # Test 1: Basic intent creation
-    try:
+    async def test_intent_creation():
         result = await secure_intent_api.create_secure_swap_from_natural_language(
             "Swap 0.0001 ETH to USDC",
             parse_swap_intent,
             ttl_minutes=5
         )
-
         if result.get("status") == "ready_for_execution":
-            test_results["tests_passed"] += 1
-            test_results["details"].append("✅ Standard intent creation")
-        else:
-            test_results["tests_failed"] += 1
-            test_results["details"].append(f"❌ Standard intent creation: {result.get('error', 'Unknown error')}")
+            return True, "✅ Standard intent creation"
+        return False, f"❌ Standard intent creation: {result.get('error', 'Unknown error')}"
 
-    except Exception as e:
-        test_results["tests_failed"] += 1
-        test_results["details"].append(f"❌ Standard intent creation exception: {str(e)}")
-
-    # Test 2: Dashboard functionality
-    try:
+    async def test_dashboard():
         dashboard = secure_intent_api.get_security_dashboard()
         if dashboard.get("framework_status") == "active":
-            test_results["tests_passed"] += 1
-            test_results["details"].append("✅ Security dashboard")
-        else:
-            test_results["tests_failed"] += 1
-            test_results["details"].append("❌ Security dashboard not active")
+            return True, "✅ Security dashboard"
+        return False, "❌ Security dashboard not active"
 
-    except Exception as e:
-        test_results["tests_failed"] += 1
-        test_results["details"].append(f"❌ Security dashboard exception: {str(e)}")
+    # Independent tests run concurrently; an exception only fails its own test
+    tests = {
+        "Standard intent creation": test_intent_creation(),
+        "Security dashboard": test_dashboard()
+    }
+    outcomes = await asyncio.gather(*tests.values(), return_exceptions=True)
+
+    test_results = {
+        "tests_passed": 0,
+        "tests_failed": 0,
+        "details": []
+    }
+
+    for name, outcome in zip(tests, outcomes):
+        if isinstance(outcome, Exception):
+            passed, detail = False, f"❌ {name} exception: {str(outcome)}"
+        else:
+            passed, detail = outcome
+        test_results["tests_passed" if passed else "tests_failed"] += 1
+        test_results["details"].append(detail)
 
     # Print results
     total_tests = test_results["tests_passed"] + test_results["tests_failed"]
@@ -806,8 +829,6 @@ __all__ = [
 
 if __name__ == "__main__":
     """Quick test when run directly"""
-    import asyncio
-
     print("🔧 Secure Intents Integration - Quick Test")
     print("=" * 50)
 
@@ -4,7 +4,7 @@ Test Real Transactions Script
 Tests the fixed swap assistant to verify real transaction generation
 """
 
-import requests
+import httpx
 import json
 import os
 import asyncio
@@ -12,19 +12,27 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-def test_fixed_version():
+async def test_fixed_version():
     """Test the fixed version of the swap assistant"""
     print("🔧 Testing Fixed Cross-Chain Swap Assistant")
     print("=" * 60)
 
     base_url = "http://localhost:8000"
 
+    # One pooled async client for every request in the run
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=4)
+    async with httpx.AsyncClient(limits=limits, timeout=15) as client:
+        return await run_checks(client, base_url)
+
+async def run_checks(client: httpx.AsyncClient, base_url: str):
+    """Run the server checks over a shared HTTP client"""
+
     # Test 1: Check if server is running the fixed version
     print("\n1️⃣  Testing Server Version")
     print("-" * 30)
 
     try:
-        response = requests.get(f"{base_url}/")
+        response = await client.get(f"{base_url}/")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Server running: {data.get('message', 'Unknown')}")
@@ -46,7 +54,7 @@ def test_fixed_version():
     print("-" * 30)
 
     try:
-        response = requests.get(f"{base_url}/debug/transaction-modes")
+        response = await client.get(f"{base_url}/debug/transaction-modes")
         if response.status_code == 200:
             data = response.json()
             config = data.get('current_configuration', {})
@@ -69,7 +77,7 @@ def test_fixed_version():
     print("-" * 30)
 
     try:
-        response = requests.post(
+        response = await client.post(
             f"{base_url}/test-ai-parser",
             json={"user_input": "Swap 0.1 ETH to USDC"},
             timeout=10
@@ -101,17 +109,22 @@ def test_fixed_version():
         "Convert 10 USDC to DAI"
     ]
 
-    for i, swap_text in enumerate(test_swaps, 1):
+    # Fire all swaps at once, then report them in order
+    responses = await asyncio.gather(
+        *(client.post(f"{base_url}/ai-swap", json={"user_input": swap_text}, timeout=15)
+          for swap_text in test_swaps),
+        return_exceptions=True
+    )
+
+    for i, (swap_text, response) in enumerate(zip(test_swaps, responses), 1):
         print(f"\n📝 Test {i}: {swap_text}")
         print("-" * 40)
 
-        try:
-            response = requests.post(
-                f"{base_url}/ai-swap",
-                json={"user_input": swap_text},
-                timeout=15
-            )
+        if isinstance(response, Exception):
+            print(f"❌ Swap test error: {response}")
+            continue
 
+        try:
             if response.status_code == 200:
                 data = response.json()
 
@@ -190,26 +203,29 @@ def test_fixed_version():
 
     print(f"\n📖 More info: {base_url}/debug/transaction-modes")
 
+# Leading 20 characters of obvious mock hashes
+MOCK_HASH_PREFIXES = tuple((pattern * 8)[:20].encode() for pattern in ('abcdef', '123456', 'fedcba'))
+
 def analyze_transaction_hash(tx_hash: str) -> bool:
     """Analyze if transaction hash looks realistic"""
     if not tx_hash or len(tx_hash) < 60:
         return False
 
     # Remove 0x prefix
-    hash_part = tx_hash.replace('0x', '').lower()
+    hash_part = tx_hash.replace('0x', '').lower().encode()
 
     # Check for obvious mock patterns
-    mock_patterns = ['abcdef' * 8, '123456' * 8, 'fedcba' * 8]
-    for pattern in mock_patterns:
-        if pattern[:20] in hash_part[:20]:  # Check first part
-            return False
+    if hash_part[:20] in MOCK_HASH_PREFIXES:
+        return False
 
-    # Check for sufficient randomness (at least 10 different characters)
-    unique_chars = len(set(hash_part))
-    if unique_chars < 10:
+    # Check for sufficient randomness (at least 10 different characters), one bit per byte value
+    seen = 0
+    for byte in hash_part:
+        seen |= 1 << byte
+    if bin(seen).count("1") < 10:
         return False
 
     return True
 
 if __name__ == "__main__":
-    test_fixed_version()
\ No newline at end of file
+    asyncio.run(test_fixed_version())
\ No newline at end of file
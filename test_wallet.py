@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Wallet Unit Tests
+Runs the wallet against an in-memory JSON-RPC node (no network access)
+"""
+
+import asyncio
+import json
+
+import httpx
+
+import wallet
+from wallet import SimpleWallet
+
+TEST_KEY = "0x" + "11" * 32
+TX = {"to": "0x1111111254EEB25477B68fb85Ed929f73A960582", "data": "0x12345678", "value": "0"}
+
+class FakeNode:
+    """Minimal JSON-RPC node: tracks the pending nonce and rejects chosen raw transactions"""
+
+    def __init__(self, pending: int = 5):
+        self.pending = pending
+        self.reject: set = set()  # Nonces whose eth_sendRawTransaction is rejected
+
+    def reply(self, call: dict) -> dict:
+        method = call["method"]
+        if method == "eth_getTransactionCount":
+            result = hex(self.pending)
+        elif method == "eth_gasPrice":
+            result = "0x3b9aca00"
+        elif method == "eth_estimateGas":
+            result = "0x30000"
+        elif method == "eth_chainId":
+            result = "0x1"
+        elif method == "eth_sendRawTransaction":
+            nonce = wallet.rlp.decode(bytes.fromhex(call["params"][0][2:]))[0]
+            nonce = int.from_bytes(nonce, "big")
+            if nonce in self.reject or nonce != self.pending:
+                return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32000, "message": "rejected"}}
+            self.pending += 1
+            result = "0x" + "ab" * 32
+        else:
+            result = None
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        replies = [self.reply(call) for call in body] if isinstance(body, list) else self.reply(body)
+        return httpx.Response(200, json=replies)
+
+def run_with_node(monkeypatch, node: FakeNode, scenario):
+    """Run an async scenario with every wallet RPC call routed to the fake node"""
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(node.handler))
+        monkeypatch.setattr(wallet, "_get_rpc_client", lambda: client)
+        try:
+            return await scenario(SimpleWallet(TEST_KEY))
+        finally:
+            await client.aclose()
+    return asyncio.run(main())
+
+def test_batch_partial_failure_releases_nonce(monkeypatch):
+    """A rejected entry in a broadcast batch must not leave a permanent nonce gap"""
+    node = FakeNode(pending=5)
+    node.reject.add(6)
+
+    async def scenario(w: SimpleWallet):
+        first = await w.sign_transaction("ethereum", TX)
+        second = await w.sign_transaction("ethereum", TX)
+        assert (first["nonce"], second["nonce"]) == (5, 6)
+
+        results = await w._broadcast_batch(
+            "ethereum", [first["signed_transaction"], second["signed_transaction"]]
+        )
+        assert [result["success"] for result in results] == [True, False]
+
+        # The next transaction reuses the rejected nonce instead of skipping to 7
+        third = await w.sign_transaction("ethereum", TX)
+        return third["nonce"]
+
+    assert run_with_node(monkeypatch, node, scenario) == 6
+
+def test_validate_private_key_rejects_trailing_newline():
+    """Only a bare 64-hex-digit key (optionally 0x-prefixed) is valid"""
+    assert wallet.validate_private_key(TEST_KEY)
+    assert wallet.validate_private_key(TEST_KEY[2:])
+    assert not wallet.validate_private_key(TEST_KEY + "\n")
@@ -4,47 +4,412 @@ Handles wallet operations, transaction signing, and blockchain interactions
 """
 
 import os
+import re
 import logging
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, List, Tuple, Callable, Awaitable, NamedTuple
 from decimal import Decimal
+from dataclasses import dataclass
+import httpx
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
+from eth_keys import keys
+from eth_utils import keccak
+from hexbytes import HexBytes
+import rlp
 from web3 import Web3
-from web3.middleware import geth_poa_middleware
 import asyncio
+import concurrent.futures
+import functools
 import hashlib
+import itertools
+import threading
+import json
 import time
+import weakref
 from dotenv import load_dotenv
 
+# Prefer orjson for JSON-RPC payloads, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: sign with libsecp256k1 directly instead of through eth_account's wrapping
+try:
+    import coincurve
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    COINCURVE_AVAILABLE = False
+
+# Optional: push-based confirmation tracking over WebSocket RPC
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# RPC endpoint configuration
-RPC_ENDPOINTS = {
-    "ethereum": os.getenv("ETHEREUM_RPC_URL", "https://eth-mainnet.g.alchemy.com/v2/demo"),
-    "arbitrum": os.getenv("ARBITRUM_RPC_URL", "https://arb-mainnet.g.alchemy.com/v2/demo"),
-    "polygon": os.getenv("POLYGON_RPC_URL", "https://polygon-mainnet.g.alchemy.com/v2/demo"),
-    "optimism": os.getenv("OPTIMISM_RPC_URL", "https://opt-mainnet.g.alchemy.com/v2/demo"),
-    "base": os.getenv("BASE_RPC_URL", "https://base-mainnet.g.alchemy.com/v2/demo")
+@dataclass(frozen=True)
+class ChainMeta:
+    """Static per-chain configuration"""
+    name: str
+    chain_id: int
+    rpc_urls: Tuple[str, ...]  # Comma-separated in *_RPC_URL; raced when more than one is set
+    ws_url: Optional[str]  # Optional: confirmation tracking falls back to HTTP polling without it
+    explorer: str  # Transaction URL prefix
+
+    @property
+    def rpc_url(self) -> str:
+        """Primary (first configured) RPC endpoint"""
+        return self.rpc_urls[0]
+
+def _env_urls(name: str, default: str) -> Tuple[str, ...]:
+    """Parse a comma-separated list of endpoint URLs from the environment"""
+    urls = tuple(url.strip() for url in os.getenv(name, default).split(",") if url.strip())
+    return urls or (default,)
+
+# Chain configuration, keyed by lowercase chain name
+CHAIN_META: Dict[str, ChainMeta] = {
+    "ethereum": ChainMeta(
+        "ethereum", 1,
+        _env_urls("ETHEREUM_RPC_URL", "https://eth-mainnet.g.alchemy.com/v2/demo"),
+        os.getenv("ETHEREUM_WS_URL"),
+        "https://etherscan.io/tx/"
+    ),
+    "arbitrum": ChainMeta(
+        "arbitrum", 42161,
+        _env_urls("ARBITRUM_RPC_URL", "https://arb-mainnet.g.alchemy.com/v2/demo"),
+        os.getenv("ARBITRUM_WS_URL"),
+        "https://arbiscan.io/tx/"
+    ),
+    "polygon": ChainMeta(
+        "polygon", 137,
+        _env_urls("POLYGON_RPC_URL", "https://polygon-mainnet.g.alchemy.com/v2/demo"),
+        os.getenv("POLYGON_WS_URL"),
+        "https://polygonscan.com/tx/"
+    ),
+    "optimism": ChainMeta(
+        "optimism", 10,
+        _env_urls("OPTIMISM_RPC_URL", "https://opt-mainnet.g.alchemy.com/v2/demo"),
+        os.getenv("OPTIMISM_WS_URL"),
+        "https://optimistic.etherscan.io/tx/"
+    ),
+    "base": ChainMeta(
+        "base", 8453,
+        _env_urls("BASE_RPC_URL", "https://base-mainnet.g.alchemy.com/v2/demo"),
+        os.getenv("BASE_WS_URL"),
+        "https://basescan.org/tx/"
+    )
 }
 
-# Chain ID mappings
-CHAIN_IDS = {
-    "ethereum": 1,
-    "arbitrum": 42161,
-    "polygon": 137,
-    "optimism": 10,
-    "base": 8453
-}
+# Prebuilt explorer URL formatters per chain name
+_EXPLORER_FMT = {name: (meta.explorer + "{}").format for name, meta in CHAIN_META.items()}
+_ETHERSCAN_FMT = _EXPLORER_FMT["ethereum"]
+
+@functools.lru_cache(maxsize=64)
+def _norm_chain(chain: str) -> str:
+    """Normalize a chain name to its lowercase key (once per distinct spelling)"""
+    return chain.lower()
+
+def _chain_meta(chain: str) -> ChainMeta:
+    """Resolve a chain name (any case) to its configuration"""
+    meta = CHAIN_META.get(_norm_chain(chain))
+    if meta is None:
+        raise ValueError(f"No RPC endpoint configured for chain: {chain}")
+    return meta
+
+# Fixed ERC-20 call selectors: balanceOf(address) and decimals()
+_BALANCEOF_SELECTOR = bytes.fromhex("70a08231")
+_DECIMALS_SELECTOR = bytes.fromhex("313ce567")
+_DECIMALS_HEX = "0x" + _DECIMALS_SELECTOR.hex()
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# Provider-less Web3 for ABI encoding/decoding only (never makes RPC calls)
+_ABI_W3 = Web3()
+_MULTICALL3 = _ABI_W3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+def _json_dumps(payload: Any) -> bytes:
+    """Encode a JSON-RPC request body"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+def _json_loads(content: Union[str, bytes]) -> Any:
+    """Decode a JSON-RPC response body"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared async client for raw JSON-RPC calls (batched requests)
+RPC_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+RPC_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=50, keepalive_expiry=60.0)
+
+# One client per event loop: pooled connections can't be reused from another loop
+_RPC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def _get_rpc_client() -> httpx.AsyncClient:
+    """Get the running loop's JSON-RPC HTTP client, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    client = _RPC_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = _RPC_CLIENTS[loop] = httpx.AsyncClient(timeout=RPC_TIMEOUT, limits=RPC_LIMITS)
+    return client
+
+# Fastest endpoint per chain (picked by racing eth_chainId), shared by every wallet
+_PREFERRED_RPC: Dict[str, str] = {}
+
+# Thread pool for CPU-bound transaction signing, shared by every wallet
+_SIGN_EXECUTOR: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+def _get_sign_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the process-wide signing thread pool, creating it on first use"""
+    global _SIGN_EXECUTOR
+
+    if _SIGN_EXECUTOR is None:
+        _SIGN_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="wallet-sign"
+        )
+    return _SIGN_EXECUTOR
+
+class _WsRpc:
+    """JSON-RPC over one persistent WebSocket, multiplexing calls and subscriptions"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self._ws = None
+        self._reader: Optional[asyncio.Task] = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._subscriptions: Dict[str, asyncio.Queue] = {}
+        self._connect_lock = asyncio.Lock()
+
+    async def _ensure_connected(self):
+        async with self._connect_lock:
+            if self._ws is None or self._ws.closed:
+                self._ws = await websockets.connect(self.url, max_size=None)
+                self._reader = asyncio.create_task(self._read_loop(self._ws))
+
+    async def _read_loop(self, ws):
+        """Route replies to their callers and notifications to their subscription queues"""
+        try:
+            async for raw in ws:
+                message = _json_loads(raw)
+
+                if message.get("method") == "eth_subscription":
+                    params = message.get("params", {})
+                    queue = self._subscriptions.get(params.get("subscription"))
+                    if queue is not None:
+                        queue.put_nowait(params.get("result"))
+                    continue
+
+                future = self._pending.pop(message.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if "error" in message:
+                    future.set_exception(ValueError(f"WebSocket RPC error: {message['error']}"))
+                else:
+                    future.set_result(message.get("result"))
+
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            # Fail in-flight calls and wake subscribers; the next call reconnects
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("WebSocket RPC connection closed"))
+            self._pending.clear()
+            for queue in self._subscriptions.values():
+                queue.put_nowait(None)
+            self._subscriptions.clear()
+
+    async def call(self, method: str, params: List[Any]) -> Any:
+        await self._ensure_connected()
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            # Sent as a text frame: some nodes reject binary JSON-RPC frames
+            await self._ws.send(
+                _json_dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}).decode()
+            )
+            return await future
+        finally:
+            # Already popped if the reply arrived; otherwise the send failed or the caller gave up
+            self._pending.pop(request_id, None)
+
+    async def subscribe_new_heads(self) -> Tuple[str, asyncio.Queue]:
+        """Subscribe to new block headers; the queue yields None if the socket drops"""
+        queue: asyncio.Queue = asyncio.Queue()
+        subscription_id = await self.call("eth_subscribe", ["newHeads"])
+        self._subscriptions[subscription_id] = queue
+        return subscription_id, queue
+
+    async def unsubscribe(self, subscription_id: str):
+        if self._subscriptions.pop(subscription_id, None) is None:
+            return
+        try:
+            await asyncio.wait_for(self.call("eth_unsubscribe", [subscription_id]), timeout=WS_CONTROL_TIMEOUT)
+        except Exception as e:
+            logger.debug(f"eth_unsubscribe failed: {e}")
+
+    async def close(self):
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            await self._reader
+        self._ws = None
+        self._reader = None
+
+# Persistent WebSocket RPC connections, shared by every wallet: event loop -> chain -> connection
+_WS_RPC: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _WsRpc]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def _get_ws_rpc(chain: str) -> Optional[_WsRpc]:
+    """Get the shared WebSocket RPC connection for a chain, if one is configured"""
+    if not WEBSOCKETS_AVAILABLE:
+        return None
+
+    meta = _chain_meta(chain)
+    connections = _WS_RPC.setdefault(asyncio.get_running_loop(), {})
+    ws_rpc = connections.get(meta.name)
+    if ws_rpc is None:
+        if not meta.ws_url:
+            return None
+        ws_rpc = connections[meta.name] = _WsRpc(meta.ws_url)
+    return ws_rpc
+
+async def shutdown():
+    """Close the running loop's JSON-RPC connections and the signing pool (call on application shutdown)"""
+    global _SIGN_EXECUTOR
+
+    # Clients of other loops can only be closed from their own loop; they are dropped with it
+    loop = asyncio.get_running_loop()
+    client = _RPC_CLIENTS.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+    for ws_rpc in _WS_RPC.pop(loop, {}).values():
+        await ws_rpc.close()
+
+    if _SIGN_EXECUTOR is not None:
+        _SIGN_EXECUTOR.shutdown(wait=False)
+        _SIGN_EXECUTOR = None
+
+# Simulated processing delay for mock swaps (seconds), off by default
+MOCK_DELAY_S = float(os.getenv("MOCK_SWAP_DELAY_S", "0"))
+
+# Delay between eth_getTransactionReceipt polls (seconds)
+RECEIPT_POLL_INTERVAL = 1.0
+
+# Upper bound for eth_subscribe/eth_unsubscribe round trips (seconds)
+WS_CONTROL_TIMEOUT = 5.0
+
+# Bulky receipt fields left out of confirmation results unless asked for
+_RECEIPT_LOG_FIELDS = frozenset(("logs", "logsBloom"))
+
+# Integer unit constants and live-transaction safety limits (wei)
+_WEI_PER_ETH = 10**18
+_WEI_PER_GWEI = 10**9
+MAX_LIVE_TX_VALUE_WEI = _WEI_PER_ETH // 10  # 0.1 ETH max
+MAX_LIVE_GAS_PRICE_WEI = 50 * _WEI_PER_GWEI  # 50 gwei max
+
+# Decimal powers of ten for converting base units (covers every realistic token decimals value)
+_DECIMAL_POW10 = [Decimal(10) ** i for i in range(37)]
+
+def _decimal_pow10(decimals: int) -> Decimal:
+    """Get 10**decimals as a Decimal, from the table when possible"""
+    return _DECIMAL_POW10[decimals] if decimals < len(_DECIMAL_POW10) else Decimal(10) ** decimals
+
+@functools.lru_cache(maxsize=512)
+def _parse_int_str(value: str) -> int:
+    """Parse a decimal or 0x-prefixed hex string (cached: gas/value strings repeat across re-quotes)"""
+    # Not int(value, 0): it rejects decimals with leading zeros such as "0100"
+    if value[:2] in ("0x", "0X"):
+        return int(value, 16)
+    return int(value)
+
+@functools.lru_cache(maxsize=1024)
+def _to_checksum(address: str) -> str:
+    """Checksum an address (cached: swaps keep targeting the same 1inch router)"""
+    return Web3.to_checksum_address(address)
+
+def _to_int(value: Union[str, int, None]) -> int:
+    """Parse an int, decimal string or 0x-prefixed hex string"""
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value
+    return _parse_int_str(value)
+
+def _hex_to_int(value: Optional[str]) -> int:
+    """Decode a JSON-RPC hex quantity ('0x' / missing means zero)"""
+    if not value or value == "0x":
+        return 0
+    return int(value, 16)
 
 class SimpleWallet:
     """
     Simple wallet implementation for transaction signing and blockchain interactions - FIXED VERSION
     """
 
+    # Fixed per-instance attributes: no __dict__, slot-based attribute access
+    __slots__ = (
+        "private_key", "account", "address", "_signing_key", "_sign",
+        "_balance_of_calldata", "_balance_of_hex", "_mock_hasher", "_nonces", "_nonce_locks"
+    )
+
+    # Token decimals never change, so they are shared across wallets: (chain, token) -> decimals
+    _decimals_cache: Dict[Tuple[str, str], int] = {}
+
+    # Checksummed token keys, shared across wallets: (chain, token as given) -> (chain, checksum token)
+    _token_keys: Dict[Tuple[str, str], Tuple[str, str]] = {}
+
+    # Process-wide wallet configured from PRIVATE_KEY, see shared()
+    _shared_instance: Optional["SimpleWallet"] = None
+    _shared_lock = threading.Lock()
+
     def __init__(self, private_key: Optional[str] = None):
         """
         Initialize wallet with private key
@@ -54,6 +419,10 @@ class SimpleWallet:
         """
         self.private_key = private_key or os.getenv("PRIVATE_KEY")
 
+        # Parsed key object reused for every signature (skips per-call key parsing)
+        self._signing_key: Optional[keys.PrivateKey] = None
+        self._sign: Optional[Callable[[Dict[str, Any]], Any]] = None
+
         if not self.private_key:
             logger.warning("No private key provided - wallet will operate in read-only mode")
             self.account = None
@@ -65,71 +434,386 @@ class SimpleWallet:
                     self.private_key = self.private_key[2:]
 
                 # Create account from private key
-                self.account: LocalAccount = Account.from_key(self.private_key)
+                self._signing_key = keys.PrivateKey(bytes.fromhex(self.private_key))
+                self.account: LocalAccount = Account.from_key(self._signing_key)
                 self.address = self.account.address
                 logger.info(f"Wallet initialized with address: {self.address}")
 
+                # Signer bound to this key: coincurve when installed, eth_account otherwise
+                if COINCURVE_AVAILABLE:
+                    self._sign = functools.partial(
+                        _sign_legacy, coincurve.PrivateKey(self._signing_key.to_bytes())
+                    )
+                else:
+                    self._sign = functools.partial(Account.sign_transaction, private_key=self._signing_key)
+
             except Exception as e:
                 logger.error(f"Failed to initialize wallet: {e}")
+                self._signing_key = None
+                self._sign = None
                 self.account = None
                 self.address = None
 
-        # Web3 connections cache
-        self._web3_connections: Dict[str, Web3] = {}
+        # balanceOf(self.address) calldata never changes for this wallet, so it is encoded once
+        self._balance_of_calldata = (
+            _BALANCEOF_SELECTOR + bytes(12) + bytes.fromhex(self.address[2:]) if self.address else None
+        )
+        self._balance_of_hex = "0x" + self._balance_of_calldata.hex() if self.address else None
+
+        # SHA-256 state already fed with the wallet prefix; mock hashes only add the varying suffix
+        self._mock_hasher = hashlib.sha256((self.address or "mock").encode())
+
+        # Next unreserved nonce per chain: reserved at sign time under the chain's lock,
+        # rolled back or dropped (refetched) when a broadcast fails
+        self._nonces: Dict[str, int] = {}
+        self._nonce_locks: Dict[str, asyncio.Lock] = {}
+
+    @classmethod
+    def shared(cls) -> "SimpleWallet":
+        """Get the process-wide wallet configured from the environment (created once)"""
+        if cls._shared_instance is None:
+            with cls._shared_lock:
+                if cls._shared_instance is None:
+                    cls._shared_instance = cls()
+        return cls._shared_instance
+
+    async def _rpc_url(self, chain: str) -> str:
+        """Get the RPC endpoint for a chain (the fastest to answer when several are configured)"""
+        meta = _chain_meta(chain)
+        if len(meta.rpc_urls) == 1:
+            return meta.rpc_url
+
+        url = _PREFERRED_RPC.get(meta.name)
+        if url is None:
+            url, _ = await self._race_rpc(chain, "eth_chainId", [])
+            _PREFERRED_RPC[meta.name] = url
+            logger.info(f"⚡ Using fastest of {len(meta.rpc_urls)} RPC endpoints for {meta.name}")
+        return url
+
+    async def _post_rpc(self, chain: str, payload: Any) -> Any:
+        """POST a JSON-RPC payload to the chain's endpoint, failing over to a new race on transport errors"""
+        try:
+            response = await _get_rpc_client().post(
+                await self._rpc_url(chain), content=_json_dumps(payload), headers=_JSON_HEADERS
+            )
+            response.raise_for_status()
+        except httpx.HTTPError:
+            # Race again on the next call instead of reusing the failed endpoint
+            _PREFERRED_RPC.pop(_chain_meta(chain).name, None)
+            raise
+        return _json_loads(response.content)
+
+    async def _race_rpc(self, chain: str, method: str, params: List[Any]) -> Tuple[str, Any]:
+        """
+        Send one JSON-RPC call to every configured endpoint at once
 
-    def get_web3_connection(self, chain: str) -> Web3:
+        Returns:
+            (endpoint URL, result) of the first successful reply
+        """
+        body = _json_dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": params})
+        client = _get_rpc_client()
+
+        async def call(url: str) -> Tuple[str, Any]:
+            response = await client.post(url, content=body, headers=_JSON_HEADERS)
+            response.raise_for_status()
+            reply = _json_loads(response.content)
+            if "error" in reply:
+                raise ValueError(f"{method} failed on {chain}: {reply['error']}")
+            return url, reply.get("result")
+
+        pending = {asyncio.ensure_future(call(url)) for url in _chain_meta(chain).rpc_urls}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = None
+                for task in done:
+                    # Check every finished task so no failure goes unretrieved
+                    if task.exception() is None:
+                        winner = winner or task
+                    else:
+                        error = task.exception()
+                if winner is not None:
+                    return winner.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise error
+
+    async def _rpc(self, chain: str, method: str, params: List[Any]) -> Any:
+        """Send a single JSON-RPC call without blocking the event loop"""
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        reply = await self._post_rpc(chain, payload)
+
+        if "error" in reply:
+            raise ValueError(f"{method} failed on {chain}: {reply['error']}")
+        return reply.get("result")
+
+    async def _rpc_batch(
+            self,
+            chain: str,
+            calls: List[Tuple[str, List[Any]]],
+            allow_errors: bool = False
+    ) -> List[Any]:
+        """
+        Send several JSON-RPC calls in one HTTP request
+
+        Args:
+            chain: Chain name
+            calls: (method, params) pairs
+            allow_errors: Return None for failed calls instead of raising
+
+        Returns:
+            Results in the same order as calls
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            for request_id, (method, params) in enumerate(calls)
+        ]
+        replies = await self._post_rpc(chain, payload)
+
+        # Providers answer a rejected batch with a single error object
+        if not isinstance(replies, list):
+            raise ConnectionError(f"RPC batch rejected by {chain}: {replies.get('error', replies)}")
+
+        # Replies may arrive in any order
+        by_id = {reply.get("id"): reply for reply in replies}
+        results = []
+        for request_id, (method, _) in enumerate(calls):
+            reply = by_id.get(request_id)
+            if reply is None or "error" in reply:
+                if allow_errors:
+                    results.append(None)
+                    continue
+                raise ValueError(f"{method} failed on {chain}: {reply.get('error') if reply else 'no reply'}")
+            results.append(reply.get("result"))
+
+        return results
+
+    async def get_balance(self, chain: str = "ethereum", token_address: Optional[str] = None) -> Decimal:
         """
-        Get Web3 connection for a specific chain
+        Get wallet balance in whole units
 
         Args:
-            chain: Chain name (e.g., 'ethereum', 'arbitrum')
+            chain: Chain name
+            token_address: ERC-20 contract address (native balance if omitted)
 
         Returns:
-            Web3 connection instance
+            Balance as a Decimal
         """
-        chain_lower = chain.lower()
+        if not self.address:
+            raise ValueError("Wallet not initialized")
 
-        if chain_lower not in self._web3_connections:
-            rpc_url = RPC_ENDPOINTS.get(chain_lower)
-            if not rpc_url:
-                raise ValueError(f"No RPC endpoint configured for chain: {chain}")
+        if token_address:
+            return await self._get_erc20_balance(chain, token_address)
 
-            # Create Web3 connection
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
+        balance_wei = _hex_to_int(await self._rpc(chain, "eth_getBalance", [self.address, "latest"]))
+        return Decimal(balance_wei) / _DECIMAL_POW10[18]
 
-            # Add PoA middleware for chains that need it (like Polygon)
-            if chain_lower in ["polygon", "arbitrum"]:
-                w3.middleware_onion.inject(geth_poa_middleware, layer=0)
+    def _token_key(self, chain: str, token_address: str) -> Tuple[str, str]:
+        """Get the (chain, checksum address) key for a token, checksumming each address once"""
+        raw_key = (_norm_chain(chain), token_address)
+        token_key = self._token_keys.get(raw_key)
 
-            # Test connection
-            try:
-                if not w3.is_connected():
-                    raise ConnectionError(f"Failed to connect to {chain} RPC")
+        if token_key is None:
+            token_key = (raw_key[0], Web3.to_checksum_address(token_address))
+            self._token_keys[raw_key] = token_key
 
-                # Get chain ID to verify connection
-                chain_id = w3.eth.chain_id
-                expected_chain_id = CHAIN_IDS.get(chain_lower)
+        return token_key
 
-                if expected_chain_id and chain_id != expected_chain_id:
-                    logger.warning(f"Chain ID mismatch for {chain}: got {chain_id}, expected {expected_chain_id}")
+    async def _get_erc20_balance(self, chain: str, token_address: str) -> Decimal:
+        """Get an ERC-20 balance with balanceOf and decimals in a single RPC round-trip"""
+        cache_key = self._token_key(chain, token_address)
+        token = cache_key[1]
 
-                logger.info(f"Connected to {chain} (Chain ID: {chain_id})")
+        calls = [("eth_call", [{"to": token, "data": self._balance_of_hex}, "latest"])]
 
+        # decimals is only fetched the first time a token is seen
+        decimals = self._decimals_cache.get(cache_key)
+        if decimals is None:
+            calls.append(("eth_call", [{"to": token, "data": _DECIMALS_HEX}, "latest"]))
+
+        results = await self._rpc_batch(chain, calls)
+        balance_raw = _hex_to_int(results[0])
+
+        if decimals is None:
+            decimals = _hex_to_int(results[1])
+            SimpleWallet._decimals_cache[cache_key] = decimals
+
+        return Decimal(balance_raw) / _decimal_pow10(decimals)
+
+    async def get_balances(self, chain: str, token_addresses: List[str]) -> Dict[str, Decimal]:
+        """
+        Get several ERC-20 balances with a single Multicall3 eth_call
+
+        Args:
+            chain: Chain name
+            token_addresses: ERC-20 contract addresses
+
+        Returns:
+            Balances keyed by token address as given (tokens whose calls fail are left out)
+        """
+        if not self.address:
+            raise ValueError("Wallet not initialized")
+        if not token_addresses:
+            return {}
+
+        tokens = [self._token_key(chain, token_address) for token_address in token_addresses]
+
+        # One balanceOf per token, plus decimals for tokens not seen before
+        calls = []
+        needs_decimals = []
+        for cache_key in tokens:
+            calls.append((cache_key[1], True, self._balance_of_calldata))
+            needs_decimals.append(cache_key not in self._decimals_cache)
+            if needs_decimals[-1]:
+                calls.append((cache_key[1], True, _DECIMALS_SELECTOR))
+
+        result = await self._rpc(chain, "eth_call", [
+            {"to": _MULTICALL3.address, "data": _MULTICALL3.encodeABI(fn_name="aggregate3", args=[calls])},
+            "latest"
+        ])
+        (replies,) = _ABI_W3.codec.decode(["(bool,bytes)[]"], bytes.fromhex(result[2:]))
+
+        # Replies come back in call order
+        balances = {}
+        reply_iter = iter(replies)
+        for token_address, cache_key, fetch_decimals in zip(token_addresses, tokens, needs_decimals):
+            balance_ok, balance_data = next(reply_iter)
+
+            if fetch_decimals:
+                decimals_ok, decimals_data = next(reply_iter)
+                if decimals_ok and decimals_data:
+                    SimpleWallet._decimals_cache[cache_key] = int.from_bytes(decimals_data, "big")
+
+            decimals = self._decimals_cache.get(cache_key)
+            if not balance_ok or decimals is None:
+                logger.warning(f"Balance lookup failed for {token_address} on {chain}")
+                continue
+
+            balances[token_address] = Decimal(int.from_bytes(balance_data, "big")) / _decimal_pow10(decimals)
+
+        return balances
+
+    async def _reserve_nonce(self, chain: str, pending_count: Optional[int] = None) -> int:
+        """Take the next nonce for a chain, starting from the pending count on first use"""
+        chain_name = _chain_meta(chain).name
+
+        # Concurrent signs on one chain each get their own nonce
+        async with self._nonce_locks.setdefault(chain_name, asyncio.Lock()):
+            nonce = self._nonces.get(chain_name)
+            if nonce is None:
+                if pending_count is None:
+                    pending_count = _hex_to_int(
+                        await self._rpc(chain, "eth_getTransactionCount", [self.address, "pending"])
+                    )
+                nonce = pending_count
+            self._nonces[chain_name] = nonce + 1
+            return nonce
+
+    def _release_nonce(self, chain: str, nonce: Optional[int] = None):
+        """Give back a reserved nonce that never reached the chain"""
+        chain_name = _chain_meta(chain).name
+
+        # Roll back only if nothing was reserved after it; otherwise refetch the pending count next time
+        if nonce is not None and self._nonces.get(chain_name) == nonce + 1:
+            self._nonces[chain_name] = nonce
+        else:
+            self._nonces.pop(chain_name, None)
+
+    async def _prepare_tx_params(
+            self,
+            chain: str,
+            transaction_data: Dict[str, Any],
+            reserve_nonce: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Build signable tx params, fetching the pending nonce (if untracked) and any missing gas/gasPrice in one batch
+
+        Args:
+            chain: Chain name
+            transaction_data: Transaction parameters
+            reserve_nonce: Take the nonce from the chain's reserved sequence; when False
+                (sign-only simulation) the next nonce is read without reserving it
+
+        Returns:
+            Transaction params for account.sign_transaction
+        """
+        meta = _chain_meta(chain)
+        to_address = _to_checksum(transaction_data['to'])
+        value = _to_int(transaction_data.get('value', '0'))
+        data = transaction_data.get('data', '0x')
+
+        # Untracked chains fetch the pending count in the same batch as the fees
+        tracked_nonce = self._nonces.get(meta.name)
+
+        calls = []
+        if tracked_nonce is None:
+            calls.append(("eth_getTransactionCount", [self.address, "pending"]))
+        if not transaction_data.get('gasPrice'):
+            calls.append(("eth_gasPrice", []))
+        if not transaction_data.get('gas'):
+            calls.append(("eth_estimateGas", [{"from": self.address, "to": to_address, "value": hex(value), "data": data}]))
+
+        replies = []
+        if calls:
+            try:
+                replies = await self._rpc_batch(chain, calls, allow_errors=True)
             except Exception as e:
-                logger.error(f"Failed to connect to {chain}: {e}")
-                # For demo purposes, continue with the connection even if verification fails
+                # Some public RPCs reject batches: send the same calls individually, concurrently
+                logger.warning(f"RPC batch failed on {chain}, sending calls individually: {e}")
+                replies = await asyncio.gather(
+                    *(self._rpc(chain, method, params) for method, params in calls),
+                    return_exceptions=True
+                )
+                replies = [None if isinstance(reply, Exception) else reply for reply in replies]
+        results = {method: result for (method, _), result in zip(calls, replies)}
+
+        gas = transaction_data.get('gas') or results.get("eth_estimateGas") or '250000'
+        gas_price = transaction_data.get('gasPrice') or results.get("eth_gasPrice") or '20000000000'
+
+        tx_params = {
+            'to': to_address,
+            'value': value,
+            'gas': max(250000, _to_int(gas)),
+            'gasPrice': _to_int(gas_price),
+            'data': data,
+            'chainId': meta.chain_id
+        }
+
+        pending_count = results.get("eth_getTransactionCount")
+        if pending_count is not None:
+            pending_count = _to_int(pending_count)
 
-            self._web3_connections[chain_lower] = w3
+        if reserve_nonce:
+            # Reserved last: nothing after this can fail and strand the nonce
+            nonce = await self._reserve_nonce(chain, pending_count)
+        elif tracked_nonce is not None:
+            nonce = tracked_nonce
+        else:
+            # Only the nonce is required; fall back to a single call if the batch did not return it
+            nonce = pending_count
+            if nonce is None:
+                nonce = _hex_to_int(await self._rpc(chain, "eth_getTransactionCount", [self.address, "pending"]))
 
-        return self._web3_connections[chain_lower]
+        tx_params['nonce'] = nonce
+        return tx_params
 
-    def sign_transaction(self, chain: str, transaction_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def sign_transaction(
+            self,
+            chain: str,
+            transaction_data: Dict[str, Any],
+            reserve_nonce: bool = True
+    ) -> Dict[str, Any]:
         """
         Sign a transaction - FIXED VERSION
 
         Args:
             chain: Chain name
             transaction_data: Transaction parameters
+            reserve_nonce: Reserve the nonce for broadcasting; pass False when only signing
+                (simulation) so no nonce is consumed
 
         Returns:
             Signed transaction data with REAL hash
@@ -137,27 +821,23 @@ class SimpleWallet:
         if not self.account:
             raise ValueError("Wallet not initialized with private key")
 
+        nonce = None
         try:
-            w3 = self.get_web3_connection(chain)
-
-            # Get current nonce
-            nonce = w3.eth.get_transaction_count(self.address)
-
-            # Prepare transaction with proper values
-            tx_params = {
-                'nonce': nonce,
-                'to': w3.to_checksum_address(transaction_data['to']),
-                'value': self._parse_value(transaction_data.get('value', '0')),
-                'gas': max(250000, self._parse_gas(transaction_data.get('gas', '250000'))),
-                'gasPrice': self._parse_gas_price(transaction_data.get('gasPrice', '20000000000')),
-                'data': transaction_data.get('data', '0x'),
-                'chainId': CHAIN_IDS.get(chain.lower(), 1)
-            }
-
-            logger.info(f"Signing transaction: {tx_params}")
-
-            # Sign transaction
-            signed_txn = self.account.sign_transaction(tx_params)
+            # Prepare transaction with proper values (nonce/fees in one RPC round-trip)
+            tx_params = await self._prepare_tx_params(chain, transaction_data, reserve_nonce)
+            nonce = tx_params['nonce']
+
+            # Summary only: full calldata can run to kilobytes
+            logger.info(
+                "Signing transaction: to=%s value=%s gas=%s nonce=%s data=%d bytes",
+                tx_params['to'], tx_params['value'], tx_params['gas'], tx_params['nonce'],
+                max(0, (len(tx_params['data']) - 2) // 2)
+            )
+
+            # Sign off the event loop so concurrent swaps keep polling while ECDSA runs
+            signed_txn = await asyncio.get_running_loop().run_in_executor(
+                _get_sign_executor(), self._sign, tx_params
+            )
 
             # Generate REAL transaction hash
             real_tx_hash = signed_txn.hash.hex()
@@ -174,45 +854,26 @@ class SimpleWallet:
 
         except Exception as e:
             logger.error(f"Transaction signing failed: {e}")
+            if reserve_nonce and nonce is not None:
+                self._release_nonce(chain, nonce)
             return {
                 "success": False,
                 "error": str(e)
             }
 
-    def _parse_value(self, value: Union[str, int]) -> int:
-        """Parse value to integer"""
-        if isinstance(value, str):
-            if value.startswith('0x'):
-                return int(value, 16)
-            else:
-                return int(value)
-        return value
-
-    def _parse_gas(self, gas: Union[str, int]) -> int:
-        """Parse gas to integer"""
-        if isinstance(gas, str):
-            if gas.startswith('0x'):
-                return int(gas, 16)
-            else:
-                return int(gas)
-        return gas
-
-    def _parse_gas_price(self, gas_price: Union[str, int]) -> int:
-        """Parse gas price to integer"""
-        if isinstance(gas_price, str):
-            if gas_price.startswith('0x'):
-                return int(gas_price, 16)
-            else:
-                return int(gas_price)
-        return gas_price
-
-    async def broadcast_transaction(self, chain: str, signed_transaction: str) -> Dict[str, Any]:
+    async def broadcast_transaction(
+            self,
+            chain: str,
+            signed_transaction: str,
+            nonce: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Broadcast a signed transaction to the blockchain
 
         Args:
             chain: Chain name
             signed_transaction: Hex-encoded signed transaction
+            nonce: Nonce reserved when signing, given back if the broadcast fails
 
         Returns:
             Transaction broadcast result
@@ -221,11 +882,16 @@ class SimpleWallet:
             raise ValueError("Wallet not initialized")
 
         try:
-            w3 = self.get_web3_connection(chain)
+            if not signed_transaction.startswith('0x'):
+                signed_transaction = '0x' + signed_transaction
 
-            # Broadcast transaction
-            tx_hash = w3.eth.send_raw_transaction(signed_transaction)
-            tx_hash_hex = tx_hash.hex()
+            # Broadcast transaction to every configured endpoint; the first to accept it wins
+            try:
+                _, tx_hash_hex = await self._race_rpc(chain, "eth_sendRawTransaction", [signed_transaction])
+            except Exception:
+                # The nonce never reached the chain (or the tracked one is stale): give it back
+                self._release_nonce(chain, nonce)
+                raise
 
             logger.info(f"Transaction broadcasted: {tx_hash_hex}")
 
@@ -242,6 +908,80 @@ class SimpleWallet:
                 "error": str(e)
             }
 
+    async def _broadcast_batch(self, chain: str, signed_transactions: List[str]) -> List[Dict[str, Any]]:
+        """Broadcast several signed transactions on one chain in a single JSON-RPC batch"""
+        signed_transactions = [tx if tx.startswith('0x') else '0x' + tx for tx in signed_transactions]
+        payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": "eth_sendRawTransaction", "params": [tx]}
+            for request_id, tx in enumerate(signed_transactions)
+        ]
+
+        try:
+            replies = await self._post_rpc(chain, payload)
+            if not isinstance(replies, list):
+                raise ConnectionError(f"RPC batch rejected by {chain}: {replies.get('error', replies)}")
+        except Exception as e:
+            # Some public RPCs reject batches: broadcast the same transactions individually
+            logger.warning(f"Broadcast batch failed on {chain}, sending individually: {e}")
+            return list(await asyncio.gather(*(
+                self.broadcast_transaction(chain, tx) for tx in signed_transactions
+            )))
+
+        # Each transaction succeeds or fails on its own; replies may arrive in any order
+        by_id = {reply.get("id"): reply for reply in replies}
+        results = []
+        for request_id in range(len(signed_transactions)):
+            reply = by_id.get(request_id)
+            if reply is None or "error" in reply:
+                error = reply.get("error") if reply else "no reply"
+                logger.error(f"Transaction broadcast failed: {error}")
+                results.append({"success": False, "error": str(error)})
+                continue
+
+            tx_hash_hex = reply.get("result")
+            logger.info(f"Transaction broadcasted: {tx_hash_hex}")
+            results.append({
+                "transaction_hash": tx_hash_hex,
+                "success": True,
+                "explorer_url": self._get_explorer_url(chain, tx_hash_hex)
+            })
+
+        # Nonces were reserved at sign time: any rejected one leaves a gap, so refetch the pending count next time
+        if not all(result["success"] for result in results):
+            self._release_nonce(chain)
+
+        return results
+
+    async def broadcast_many(self, transactions: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Broadcast signed transactions concurrently, batching those that share a chain
+
+        Args:
+            transactions: (chain, signed_transaction) pairs
+
+        Returns:
+            Broadcast results in the same order as transactions
+        """
+        if not self.account:
+            raise ValueError("Wallet not initialized")
+
+        by_chain: Dict[str, List[int]] = {}
+        for index, (chain, _) in enumerate(transactions):
+            by_chain.setdefault(_norm_chain(chain), []).append(index)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(transactions)
+
+        async def send(chain: str, indexes: List[int]):
+            if len(indexes) == 1:
+                results[indexes[0]] = await self.broadcast_transaction(*transactions[indexes[0]])
+                return
+            batch = await self._broadcast_batch(chain, [transactions[index][1] for index in indexes])
+            for index, result in zip(indexes, batch):
+                results[index] = result
+
+        await asyncio.gather(*(send(chain, indexes) for chain, indexes in by_chain.items()))
+        return results
+
     async def execute_real_swap(
             self,
             transaction_data: Dict[str, Any],
@@ -265,7 +1005,8 @@ class SimpleWallet:
 
         try:
             # Step 1: Sign the transaction (creates real hash)
-            signed_result = self.sign_transaction(chain, transaction_data)
+            # Only a transaction that will be broadcast consumes a nonce
+            signed_result = await self.sign_transaction(chain, transaction_data, reserve_nonce=broadcast)
 
             if not signed_result.get("success"):
                 raise Exception(f"Transaction signing failed: {signed_result.get('error')}")
@@ -277,7 +1018,8 @@ class SimpleWallet:
                 logger.warning("🚨 BROADCASTING REAL TRANSACTION TO BLOCKCHAIN")
                 broadcast_result = await self.broadcast_transaction(
                     chain,
-                    signed_result["signed_transaction"]
+                    signed_result["signed_transaction"],
+                    nonce=signed_result["nonce"]
                 )
 
                 if broadcast_result.get("success"):
@@ -312,6 +1054,42 @@ class SimpleWallet:
                 "execution_type": "failed"
             }
 
+    async def execute_real_swaps(
+            self,
+            swaps: List[Tuple[Dict[str, Any], str]],
+            broadcast: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several real swaps (e.g. the legs of a cross-chain swap), chains concurrently
+
+        Legs on the same chain run one after another so their nonces are signed and
+        broadcast in order.
+
+        Args:
+            swaps: (transaction_data, chain) pairs
+            broadcast: Whether to actually broadcast to blockchain
+
+        Returns:
+            Execution results in the same order as swaps
+        """
+        by_chain: Dict[str, List[int]] = {}
+        for index, (_, chain) in enumerate(swaps):
+            by_chain.setdefault(_norm_chain(chain), []).append(index)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(swaps)
+
+        async def run_chain(indexes: List[int]):
+            for index in indexes:
+                transaction_data, chain = swaps[index]
+                try:
+                    results[index] = await self.execute_real_swap(transaction_data, chain, broadcast)
+                except Exception as e:
+                    # Report unexpected errors in the same shape as execute_real_swap failures
+                    results[index] = {"success": False, "error": str(e), "execution_type": "failed"}
+
+        await asyncio.gather(*(run_chain(indexes) for indexes in by_chain.values()))
+        return results
+
     async def execute_live_swap(
             self,
             transaction_data: Dict[str, Any],
@@ -335,15 +1113,15 @@ class SimpleWallet:
 
         # SAFETY CHECK 1: Validate transaction value
         if safety_checks:
-            tx_value = self._parse_value(transaction_data.get('value', '0'))
-            max_value = int(0.1 * 10**18)  # 0.1 ETH max
+            tx_value = _to_int(transaction_data.get('value', '0'))
+            max_value = MAX_LIVE_TX_VALUE_WEI
 
             if tx_value > max_value:
                 raise ValueError(f"Transaction value {tx_value} exceeds safety limit {max_value}")
 
         # SAFETY CHECK 2: Validate gas price
-        gas_price = self._parse_gas_price(transaction_data.get('gasPrice', '20000000000'))
-        max_gas_price = int(50 * 10**9)  # 50 gwei max
+        gas_price = _to_int(transaction_data.get('gasPrice', '20000000000'))
+        max_gas_price = MAX_LIVE_GAS_PRICE_WEI
 
         if safety_checks and gas_price > max_gas_price:
             raise ValueError(f"Gas price {gas_price} exceeds safety limit {max_gas_price}")
@@ -351,7 +1129,7 @@ class SimpleWallet:
         try:
             # Step 1: Sign the transaction
             logger.warning("🚨 PREPARING LIVE BLOCKCHAIN TRANSACTION")
-            signed_result = self.sign_transaction(chain, transaction_data)
+            signed_result = await self.sign_transaction(chain, transaction_data)
 
             if not signed_result.get("success"):
                 raise Exception(f"Transaction signing failed: {signed_result.get('error')}")
@@ -361,7 +1139,7 @@ class SimpleWallet:
 
             # Step 2: BROADCAST TO BLOCKCHAIN
             logger.warning("🚨 BROADCASTING TO BLOCKCHAIN - REAL MONEY TRANSACTION!")
-            broadcast_result = await self.broadcast_transaction(chain, signed_tx)
+            broadcast_result = await self.broadcast_transaction(chain, signed_tx, nonce=signed_result["nonce"])
 
             if broadcast_result.get("success"):
                 logger.info(f"✅ LIVE TRANSACTION BROADCASTED: {real_tx_hash}")
@@ -386,26 +1164,91 @@ class SimpleWallet:
                 "execution_type": "live_failed"
             }
 
+    async def _watch_receipt(
+            self,
+            call: Callable[[str, List[Any]], Awaitable[Any]],
+            wait_next: Callable[[], Awaitable[Any]],
+            tx_hash: str,
+            confirmations: int
+    ) -> Dict[str, Any]:
+        """Check for a receipt with enough confirmations, waiting on wait_next() between checks"""
+        while True:
+            receipt = await call("eth_getTransactionReceipt", [tx_hash])
+
+            if receipt and receipt.get("blockNumber"):
+                if confirmations <= 1:
+                    return receipt
+
+                latest_block = _hex_to_int(await call("eth_blockNumber", []))
+                if latest_block - _hex_to_int(receipt["blockNumber"]) + 1 >= confirmations:
+                    return receipt
+
+            await wait_next()
+
+    async def _wait_for_receipt(
+            self,
+            chain: str,
+            tx_hash: str,
+            confirmations: int,
+            timeout: float
+    ) -> Dict[str, Any]:
+        """Wait for a receipt, re-checking on each new block (WebSocket) or poll interval (HTTP)"""
+        async def watch():
+            ws_rpc = _get_ws_rpc(chain)
+            subscription = None
+
+            if ws_rpc is not None:
+                try:
+                    subscription = await asyncio.wait_for(ws_rpc.subscribe_new_heads(), timeout=WS_CONTROL_TIMEOUT)
+                except Exception as e:
+                    logger.warning(f"newHeads subscription failed on {chain}, polling over HTTP: {e}")
+
+            if subscription is None:
+                return await self._watch_receipt(
+                    lambda method, params: self._rpc(chain, method, params),
+                    lambda: asyncio.sleep(RECEIPT_POLL_INTERVAL),
+                    tx_hash,
+                    confirmations
+                )
+
+            subscription_id, heads = subscription
+
+            async def next_head():
+                if await heads.get() is None:
+                    raise ConnectionError("WebSocket RPC connection closed")
+
+            try:
+                return await self._watch_receipt(ws_rpc.call, next_head, tx_hash, confirmations)
+            finally:
+                await ws_rpc.unsubscribe(subscription_id)
+
+        # Subscribing, watching and unsubscribing all count against the deadline
+        try:
+            return await asyncio.wait_for(watch(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"Transaction {tx_hash} not confirmed within {timeout}s")
+
     async def wait_for_confirmation_with_status(
             self,
             chain: str,
             tx_hash: str,
             confirmations: int = 1,
-            timeout: int = 300
+            timeout: int = 300,
+            include_logs: bool = False
     ) -> Dict[str, Any]:
         """
         Wait for live transaction confirmation with status updates
+
+        The receipt's logs and logsBloom are only returned with include_logs=True
         """
         try:
-            w3 = self.get_web3_connection(chain)
-
             logger.info(f"⏳ Waiting for transaction confirmation: {tx_hash}")
 
             # Wait for transaction receipt
-            receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+            receipt = await self._wait_for_receipt(chain, tx_hash, confirmations, timeout)
 
             # Check if transaction was successful
-            success = receipt.status == 1
+            success = _hex_to_int(receipt.get("status")) == 1
 
             if success:
                 logger.info(f"✅ TRANSACTION CONFIRMED: {tx_hash}")
@@ -415,10 +1258,12 @@ class SimpleWallet:
             return {
                 "success": success,
                 "transaction_hash": tx_hash,
-                "block_number": receipt.blockNumber,
-                "gas_used": receipt.gasUsed,
+                "block_number": _hex_to_int(receipt.get("blockNumber")),
+                "gas_used": _hex_to_int(receipt.get("gasUsed")),
                 "status": "confirmed_success" if success else "confirmed_failed",
-                "receipt": dict(receipt),
+                "receipt": receipt if include_logs else {
+                    key: value for key, value in receipt.items() if key not in _RECEIPT_LOG_FIELDS
+                },
                 "explorer_url": self._get_explorer_url(chain, tx_hash)
             }
 
@@ -431,26 +1276,32 @@ class SimpleWallet:
                 "transaction_hash": tx_hash
             }
 
+    async def wait_for_confirmation(
+            self,
+            chain: str,
+            tx_hash: str,
+            confirmations: int = 1,
+            timeout: int = 300,
+            include_logs: bool = False
+    ) -> Dict[str, Any]:
+        """Wait for transaction confirmation (used by the live execution path)"""
+        return await self.wait_for_confirmation_with_status(chain, tx_hash, confirmations, timeout, include_logs)
+
     def _get_explorer_url(self, chain: str, tx_hash: str) -> str:
         """Get blockchain explorer URL for transaction"""
-
-        explorers = {
-            "ethereum": "https://etherscan.io/tx/0x",
-            "arbitrum": "https://arbiscan.io/tx/0x",
-            "polygon": "https://polygonscan.com/tx/0x",
-            "optimism": "https://optimistic.etherscan.io/tx/0x",
-            "base": "https://basescan.org/tx/0x"
-        }
-
-        base_url = explorers.get(chain.lower(), "https://etherscan.io/tx/0x")
-        return f"{base_url}{tx_hash}"
+        # Hashes from web3 already carry the 0x prefix
+        if not tx_hash.startswith("0x"):
+            tx_hash = "0x" + tx_hash
+        explorer_fmt = _EXPLORER_FMT.get(_norm_chain(chain), _ETHERSCAN_FMT)
+        return explorer_fmt(tx_hash)
 
     # UPDATED Mock functions for compatibility
 
     async def mock_execute_swap(
             self,
             transaction_data: Dict[str, Any],
-            chain: str
+            chain: str,
+            simulate_latency: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         UPDATED Mock swap execution with better hash generation
@@ -458,22 +1309,24 @@ class SimpleWallet:
         Args:
             transaction_data: Transaction parameters from 1inch
             chain: Chain name
+            simulate_latency: Artificial processing delay in seconds (defaults to MOCK_SWAP_DELAY_S)
 
         Returns:
             Enhanced mock transaction execution result
         """
 
         # Simulate transaction processing delay
-        await asyncio.sleep(0.5)
+        if simulate_latency is None:
+            simulate_latency = MOCK_DELAY_S
+        if simulate_latency > 0:
+            await asyncio.sleep(simulate_latency)
 
         # Generate realistic mock hash based on actual data
-        if self.address:
-            hash_input = f"{self.address}{transaction_data.get('to', '')}{time.time()}"
-        else:
-            hash_input = f"mock{transaction_data.get('to', '')}{time.time()}"
+        hasher = self._mock_hasher.copy()
+        hasher.update(f"|{transaction_data.get('to', '')}|{time.time_ns()}".encode())
 
         # Create hash that looks real but is clearly mock
-        mock_hash = "0x" + hashlib.sha256(hash_input.encode()).hexdigest()
+        mock_hash = "0x" + hasher.hexdigest()
 
         return {
             "transaction_hash": mock_hash,
@@ -486,8 +1339,37 @@ class SimpleWallet:
             "note": "This is a mock transaction for testing purposes"
         }
 
+class _SignedTx(NamedTuple):
+    """The fields of eth_account's SignedTransaction that callers use"""
+    rawTransaction: HexBytes
+    hash: HexBytes
+
+def _sign_legacy(signing_key: "coincurve.PrivateKey", tx: Dict[str, Any]) -> _SignedTx:
+    """EIP-155 sign a legacy transaction as built by _prepare_tx_params"""
+    chain_id = tx['chainId']
+    data = tx['data']
+    fields = [
+        tx['nonce'], tx['gasPrice'], tx['gas'], bytes.fromhex(tx['to'][2:]), tx['value'],
+        bytes.fromhex(data[2:] if data[:2] in ("0x", "0X") else data)
+    ]
+
+    # libsecp256k1 returns r || s || recovery id with s already in the low half
+    signature = signing_key.sign_recoverable(keccak(rlp.encode(fields + [chain_id, 0, 0])), hasher=None)
+    v = signature[64] + chain_id * 2 + 35
+    r = int.from_bytes(signature[:32], "big")
+    s = int.from_bytes(signature[32:64], "big")
+
+    raw_transaction = rlp.encode(fields + [v, r, s])
+    return _SignedTx(HexBytes(raw_transaction), HexBytes(keccak(raw_transaction)))
+
 # Utility functions
 
+# 32-byte hex private key, optionally 0x-prefixed
+_PRIVATE_KEY_RE = re.compile(r'(?:0x)?[0-9a-fA-F]{64}')
+
+# Valid secp256k1 private keys lie in [1, n-1]
+SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
 def generate_new_wallet() -> Dict[str, str]:
     """
     Generate a new wallet with private key and address
@@ -518,30 +1400,29 @@ def validate_address(address: str) -> bool:
     except Exception:
         return False
 
-def validate_private_key(private_key: str) -> bool:
+def validate_private_key(private_key: str, strict: bool = False) -> bool:
     """
     Validate private key format
 
     Args:
         private_key: Private key to validate
+        strict: Also derive the account from the key (slow; the range check already rejects unusable keys)
 
     Returns:
         True if valid, False otherwise
     """
-    try:
-        if private_key.startswith('0x'):
-            private_key = private_key[2:]
+    if not isinstance(private_key, str) or not _PRIVATE_KEY_RE.fullmatch(private_key):
+        return False
 
-        # Check if it's a valid hex string of correct length
-        if len(private_key) != 64:
-            return False
+    if not 0 < int(private_key, 16) < SECP256K1_ORDER:
+        return False
 
-        int(private_key, 16)  # This will raise ValueError if not valid hex
+    if not strict:
+        return True
 
-        # Try to create account to verify
+    try:
         Account.from_key(private_key)
         return True
-
     except Exception:
         return False
 
@@ -570,7 +1451,7 @@ async def test_wallet():
         }
 
         print("\n📝 Testing transaction signing...")
-        signed_result = wallet.sign_transaction("ethereum", mock_tx_data)
+        signed_result = await wallet.sign_transaction("ethereum", mock_tx_data, reserve_nonce=False)
 
         if signed_result.get("success"):
             tx_hash = signed_result["transaction_hash"]